@@ -803,6 +803,31 @@ class _PynativeExecutor:
         """
         self._executor.grad_net(grad, obj, weights, grad_position, *args, *(kwargs.values()))
 
+    def grad_and_run(self, obj, grad, weights, grad_position, *args, **kwargs):
+        """
+        Get grad graph, run it and clean resource after building grad graph.
+
+        It is equivalent to calling `grad`, `__call__` and `clear_grad` in sequence, but packs the
+        input arguments only once.
+
+        Args:
+            obj (Function/Cell): The function or cell instance.
+            grad (GradOperation): The gradoperation object.
+            weights (ParameterTuple): The weights of cell instance.
+            grad_position (Union(int, tuple[int])): If int, get the gradient with respect to single input.
+              If tuple, get the gradients with respect to selected inputs. 'grad_position' begins with 0.
+            args (tuple): Function or cell input arguments.
+            kwargs (dict): keyword arguments.
+
+        Return:
+            The return object after running grad graph.
+        """
+        args = args + tuple(kwargs.values())
+        self._executor.grad_net(grad, obj, weights, grad_position, *args)
+        out = self._executor(obj, grad.sens_param, args)
+        self._executor.clear_grad(obj, *args)
+        return out
+
     def del_cell(self, obj):
         """
         Clean resource for cell.
@@ -16,11 +16,14 @@
 # ============================================================================
 
 """Basic composite operations."""
-from functools import partial
+from copy import deepcopy
+from functools import lru_cache
+from itertools import starmap
 from types import FunctionType
 import mindspore as ms
 from mindspore import context
 from mindspore.common.parameter import Parameter, ParameterTuple
+from mindspore.common.tensor import Tensor
 from mindspore import log as logger
 from ..._c_expression import GradOperation_, HyperMap_, Map_, MultitypeFuncGraph_, Tail_, Shard_, \
     TupleAdd_, UnpackCall_, ZipOperation_, ListAppend_, TupleGetItemTensor_, ListInsert_, \
@@ -106,6 +109,38 @@ def core(fn=None, **flags):
     return ret
 
 
+# The cached wrappers hold their fn strongly, so each cache keeps at most this many fns (and their Parameters) alive.
+_FN_CACHE_SIZE = 4
+
+
+def _get_cached_fn(cache, key):
+    """Get fn from cache and mark it as the most recently used entry, return None on a miss."""
+    fn = cache.pop(key, None)
+    if fn is not None:
+        cache[key] = fn
+    return fn
+
+
+def _cache_fn(cache, key, fn):
+    """Store fn in cache, evicting the least recently used entry when the cache is full."""
+    if len(cache) >= _FN_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = fn
+
+
+def _get_forward_inputs(sens_param, args, kwargs):
+    """Strip the sensitivity input, passed positionally or as the 'sens' keyword, from the grad inputs."""
+    if not sens_param:
+        return args, kwargs
+    if not kwargs or 'sens' not in kwargs:
+        return args[:-1], kwargs
+    if len(kwargs) == 1:
+        return args, {}
+    new_kwargs = kwargs.copy()
+    new_kwargs.pop('sens')
+    return args, new_kwargs
+
+
 def _get_grad_weights_id(weights=None):
     """generate id of parameters"""
     res = ""
@@ -336,6 +371,9 @@ class GradOperation(GradOperation_):
          [ 1.29020004e+01]),))
     """
 
+    __slots__ = ('get_all', 'get_by_list', 'sens_param', '_grad_fn_cache', '_graph_grad', 'pynative_',
+                 'grad_position')
+
     def __init__(self, get_all=False, get_by_list=False, sens_param=False):
         """Initialize GradOperation."""
         if not isinstance(get_all, bool):
@@ -346,79 +384,107 @@ class GradOperation(GradOperation_):
         if not isinstance(sens_param, bool):
             raise TypeError(f"For 'GradOperation', the 'sens_param' should be bool, "
                             f"but got {type(sens_param).__name__}")
+        self._init_grad(get_all, get_by_list, sens_param)
+
+    @classmethod
+    def _create_unchecked(cls, get_all, get_by_list, sens_param):
+        """Create a GradOperation from arguments already known to be bool, skipping the type checks."""
+        grad = cls.__new__(cls)
+        grad._init_grad(get_all, get_by_list, sens_param)
+        return grad
+
+    def _init_grad(self, get_all, get_by_list, sens_param):
+        """Set the attributes of GradOperation and initialize the C++ object."""
         self.get_all = get_all
         self.get_by_list = get_by_list
         self.sens_param = sens_param
         GradOperation_.__init__(self, 'grad', get_all, get_by_list, sens_param, False, False, False)
-        self.grad_fn = None
-        self.fn = None
-        self.weights_id = None
+        self._grad_fn_cache = {}
+        self._graph_grad = None
         self.pynative_ = False
         self.grad_position = (0,)
 
     def __call__(self, fn, weights=None):
         weights_id = _get_grad_weights_id(weights)
-        if self.grad_fn is not None and self.fn == fn and self.weights_id == weights_id:
-            return self.grad_fn
-        grad_ = GradOperation(self.get_all, self.get_by_list, self.sens_param)
+        # The mode is part of the key since context.set_context may change it between calls, and the
+        # grad function built for one mode must not be returned in the other.
+        mode = context._get_mode()  # pylint: disable=W0212
+        cache_key = (fn, weights_id, mode)
+        grad_fn = _get_cached_fn(self._grad_fn_cache, cache_key)
+        if grad_fn is not None:
+            return grad_fn
         # If calling Grad in GRAPH_MODE or calling Grad in ms_function, do grad in GRAPH_MODE
         # If calling Grad in pure PYNATIVE_MODE do grad in PYNATIVE_MODE
         #   In pure PYNATIVE_MODE the out layer after_grad just used to set pynative flag for inner GradOperation.
         #   In PYNATIVE_MODE calling Grad from ms_function, use the out layer after_grad do grad in GRAPH_MODE.
-        if context.get_context("mode") == context.GRAPH_MODE:
-            dynamic_shape_inputs = None
-            if isinstance(fn, ms.nn.Cell):
-                dynamic_shape_inputs = fn.get_inputs()
-                fn.grad_ops_label = True
-            if self.get_by_list:
-                @ms_function(input_signature=dynamic_shape_inputs)
-                def after_grad(*args):
-                    return grad_(fn, weights)(*args)
-            else:
-                @ms_function(input_signature=dynamic_shape_inputs)
-                def after_grad(*args):
-                    return grad_(fn)(*args)
+        if mode == context.GRAPH_MODE:
+            # The inner GradOperation holds no per-fn state in GRAPH_MODE, so one instance is shared by all fns.
+            if self._graph_grad is None:
+                self._graph_grad = self._create_inner_grad()
+            after_grad = self._build_graph_grad_fn(fn, weights, self._graph_grad)
         elif self.pynative_:
-            @_wrap_func
+            after_grad = self._build_pynative_grad_fn(fn, weights, weights_id, self._create_inner_grad())
+        else:
+            after_grad = self._build_pynative_entry_grad_fn(fn, weights, self._create_inner_grad())
+        _cache_fn(self._grad_fn_cache, cache_key, after_grad)
+        return after_grad
+
+    def _create_inner_grad(self):
+        """Create the GradOperation with the same configuration which does the grad for the gradient function."""
+        return GradOperation._create_unchecked(self.get_all, self.get_by_list, self.sens_param)
+
+    def _build_graph_grad_fn(self, fn, weights, grad_):
+        """Build the gradient function which does grad in GRAPH_MODE."""
+        dynamic_shape_inputs = None
+        if isinstance(fn, ms.nn.Cell):
+            dynamic_shape_inputs = fn.get_inputs()
+            fn.grad_ops_label = True
+        if self.get_by_list:
+            @ms_function(input_signature=dynamic_shape_inputs)
+            def after_grad(*args):
+                return grad_(fn, weights)(*args)
+        else:
+            @ms_function(input_signature=dynamic_shape_inputs)
+            def after_grad(*args):
+                return grad_(fn)(*args)
+        return after_grad
+
+    def _build_pynative_grad_fn(self, fn, weights, weights_id, grad_):
+        """Build the gradient function which does grad in PYNATIVE_MODE."""
+        is_function = isinstance(fn, FunctionType)
+
+        @_wrap_func
+        def after_grad(*args, **kwargs):
+            self._pynative_forward_run(fn, is_function, grad_, weights_id, args, kwargs)
+            return _pynative_executor.grad_and_run(fn, grad_, weights, self.grad_position, *args, **kwargs)
+        return after_grad
+
+    def _build_pynative_entry_grad_fn(self, fn, weights, grad_):
+        """Build the out layer gradient function which sets the pynative flag for the inner GradOperation."""
+        grad_.pynative_ = True
+        # after_grad of this branch can't use @ms_function, just directly call grad_
+        if self.get_by_list:
             def after_grad(*args, **kwargs):
-                self._pynative_forward_run(fn, grad_, args, kwargs)
-                _pynative_executor.grad(fn, grad_, weights, self.grad_position, *args, **kwargs)
-                out = _pynative_executor(fn, grad_.sens_param, *args, **kwargs)
-                _pynative_executor.clear_grad(fn, *args, **kwargs)
-                return out
+                return grad_(fn, weights)(*args, **kwargs)
         else:
-            grad_.pynative_ = True
-            # after_grad of this branch can't use @ms_function, just directly call grad_
-            if self.get_by_list:
-                def after_grad(*args, **kwargs):
-                    return grad_(fn, weights)(*args, **kwargs)
-            else:
-                def after_grad(*args, **kwargs):
-                    return grad_(fn)(*args, **kwargs)
-
-        self.grad_fn = after_grad
-        self.fn = fn
-        self.weights_id = weights_id
-        return self.grad_fn
+            def after_grad(*args, **kwargs):
+                return grad_(fn)(*args, **kwargs)
+        return after_grad
 
-    def _pynative_forward_run(self, fn, grad, args, kwargs):
+    def _pynative_forward_run(self, fn, is_function, grad, weights_id, args, kwargs):
         """ Pynative forward run to build grad graph. """
-        new_kwargs = kwargs
-        if self.sens_param:
-            if not 'sens' in kwargs.keys():
-                args = args[:-1]
-            else:
-                new_kwargs = kwargs.copy()
-                new_kwargs.pop('sens')
-        if isinstance(fn, FunctionType):
-            if not _pynative_executor.check_run(grad, fn, self.weights_id, *args, **new_kwargs):
+        args, new_kwargs = _get_forward_inputs(self.sens_param, args, kwargs)
+        # check_run is asked on every step instead of being cached by input signature: whether the forward
+        # graph has to be built depends on the executor state of the current step, not only on the inputs.
+        if is_function:
+            if not _pynative_executor.check_run(grad, fn, weights_id, *args, **new_kwargs):
                 _pynative_executor.set_grad_flag(True)
                 _pynative_executor.new_graph(fn, *args, **new_kwargs)
                 output = fn(*args, **new_kwargs)
                 _pynative_executor.end_graph(fn, output, *args, **new_kwargs)
         else:
             # Check if fn have run already
-            if not _pynative_executor.check_run(grad, fn, self.weights_id, *args, **new_kwargs):
+            if not _pynative_executor.check_run(grad, fn, weights_id, *args, **new_kwargs):
                 fn.set_grad()
                 fn(*args, **new_kwargs)
                 fn.set_grad(False)
@@ -455,6 +521,9 @@ class _Grad(GradOperation_):
     A higher-order function which is used to generate the gradient function by position for the input function.
     """
 
+    __slots__ = ('get_by_position', 'get_by_list', 'sens_param', 'has_aux', 'get_value', '_grad_fn_cache',
+                 '_graph_grad', 'pynative_')
+
     def __init__(self, get_by_list=False, sens_param=False, get_by_position=False, has_aux=False, get_value=False):
         """Initialize _Grad."""
         if not isinstance(get_by_position, bool):
@@ -472,25 +541,92 @@ class _Grad(GradOperation_):
         if not isinstance(get_value, bool):
             raise TypeError(f"For '_Grad', the 'get_value' should be bool, "
                             f"but got {type(get_value).__name__}")
+        self._init_grad(get_by_list, sens_param, get_by_position, has_aux, get_value)
+
+    @classmethod
+    def _create_unchecked(cls, get_by_list, sens_param, get_by_position, has_aux, get_value):
+        """Create a _Grad from arguments already known to be bool, skipping the type checks."""
+        grad = cls.__new__(cls)
+        grad._init_grad(get_by_list, sens_param, get_by_position, has_aux, get_value)
+        return grad
+
+    def _init_grad(self, get_by_list, sens_param, get_by_position, has_aux, get_value):
+        """Set the attributes of _Grad and initialize the C++ object."""
         self.get_by_position = get_by_position
         self.get_by_list = get_by_list
         self.sens_param = sens_param
         self.has_aux = has_aux
         self.get_value = get_value
         GradOperation_.__init__(self, 'grad', False, get_by_list, sens_param, get_by_position, has_aux, get_value)
-        self.grad_fn = None
-        self.fn = None
+        self._grad_fn_cache = {}
+        self._graph_grad = None
         self.pynative_ = False
-        self.grad_position = None
-        self.weights_id = None
-        self.grad_hash_id = None
 
     def __call__(self, fn, weights=None, grad_position=0):
         weights_id = _get_grad_weights_id(weights)
-        if self.grad_fn is not None and self.fn == fn and self.grad_position == grad_position and \
-                self.weights_id == weights_id:
-            return self.grad_fn
+        # The mode is part of the key, see GradOperation.__call__.
+        mode = context._get_mode()  # pylint: disable=W0212
+        cache_key = (fn, weights_id, grad_position, mode)
+        grad_fn = _get_cached_fn(self._grad_fn_cache, cache_key)
+        if grad_fn is not None:
+            return grad_fn
+        # If calling Grad in GRAPH_MODE or calling Grad in ms_function, do grad in GRAPH_MODE
+        # If calling Grad in pure PYNATIVE_MODE do grad in PYNATIVE_MODE
+        #   In pure PYNATIVE_MODE the out layer after_grad just used to set pynative flag for inner GradOperation.
+        #   In PYNATIVE_MODE calling Grad from ms_function, use the out layer after_grad do grad in GRAPH_MODE.
+        if mode == context.GRAPH_MODE:
+            if self._graph_grad is None:
+                self._graph_grad = self._create_inner_grad()
+            after_grad = self._build_graph_grad_fn(fn, weights, grad_position, self._graph_grad)
+        elif self.pynative_:
+            after_grad = self._build_pynative_grad_fn(fn, weights, weights_id, grad_position, self._create_inner_grad())
+        else:
+            after_grad = self._build_pynative_entry_grad_fn(fn, weights, grad_position, self._create_inner_grad())
+        _cache_fn(self._grad_fn_cache, cache_key, after_grad)
+        return after_grad
+
+    def _create_inner_grad(self):
+        """Create the _Grad with the same configuration which does the grad for the gradient function."""
+        return _Grad._create_unchecked(self.get_by_list, self.sens_param, self.get_by_position, self.has_aux,
+                                       self.get_value)
+
+    def _build_graph_grad_fn(self, fn, weights, grad_position, grad_):
+        """Build the gradient function which does grad in GRAPH_MODE."""
+        dynamic_shape_inputs = None
+        if isinstance(fn, ms.nn.Cell):
+            dynamic_shape_inputs = fn.get_inputs()
+        if self.get_by_position:
+            @ms_function(input_signature=dynamic_shape_inputs)
+            def after_grad(*args):
+                return grad_(fn, weights, grad_position)(*args)
+        else:
+            if self.get_by_list:
+                @ms_function(input_signature=dynamic_shape_inputs)
+                def after_grad(*args):
+                    return grad_(fn, weights)(*args)
+            else:
+                @ms_function(input_signature=dynamic_shape_inputs)
+                def after_grad(*args):
+                    return grad_(fn)(*args)
+        return after_grad
+
+    def _build_pynative_grad_fn(self, fn, weights, weights_id, grad_position, grad_):
+        """Build the gradient function which does grad in PYNATIVE_MODE."""
+        is_function = isinstance(fn, FunctionType)
+
+        @_wrap_func
+        def after_grad(*args, **kwargs):
+            res = self._pynative_forward_run(fn, is_function, grad_, (grad_position, weights_id), args, kwargs)
+            out = _pynative_executor.grad_and_run(fn, grad_, weights, grad_position, *args, **kwargs)
+            if self.get_value:
+                return res, out
+            if self.has_aux:
+                return out, res[1:]
+            return out
+        return after_grad
 
+    def _build_pynative_entry_grad_fn(self, fn, weights, grad_position, grad_):
+        """Build the out layer gradient function which sets the pynative flag for the inner _Grad."""
         def aux_fn(*args):
             outputs = fn(*args)
             if not isinstance(outputs, tuple) or len(outputs) < 2:
@@ -501,77 +637,29 @@ class _Grad(GradOperation_):
                 res += (stop_gradient(item),)
             return res
 
-        grad_ = _Grad(self.get_by_list, self.sens_param, self.get_by_position, self.has_aux, self.get_value)
-        # If calling Grad in GRAPH_MODE or calling Grad in ms_function, do grad in GRAPH_MODE
-        # If calling Grad in pure PYNATIVE_MODE do grad in PYNATIVE_MODE
-        #   In pure PYNATIVE_MODE the out layer after_grad just used to set pynative flag for inner GradOperation.
-        #   In PYNATIVE_MODE calling Grad from ms_function, use the out layer after_grad do grad in GRAPH_MODE.
-        if context.get_context("mode") == context.GRAPH_MODE:
-            dynamic_shape_inputs = None
-            if isinstance(fn, ms.nn.Cell):
-                dynamic_shape_inputs = fn.get_inputs()
-            if self.get_by_position:
-                @ms_function(input_signature=dynamic_shape_inputs)
-                def after_grad(*args):
-                    return grad_(fn, weights, grad_position)(*args)
-            else:
-                if self.get_by_list:
-                    @ms_function(input_signature=dynamic_shape_inputs)
-                    def after_grad(*args):
-                        return grad_(fn, weights)(*args)
-                else:
-                    @ms_function(input_signature=dynamic_shape_inputs)
-                    def after_grad(*args):
-                        return grad_(fn)(*args)
-        elif self.pynative_:
-
-            @_wrap_func
+        grad_.pynative_ = True
+        fn_ = fn
+        if self.has_aux:
+            fn_ = aux_fn
+        # after_grad of this branch can't use @ms_function, just directly call grad_
+        if self.get_by_position:
             def after_grad(*args, **kwargs):
-                res = self._pynative_forward_run(fn, grad_, args, kwargs)
-                _pynative_executor.grad(fn, grad_, weights, grad_position, *args, **kwargs)
-                out = _pynative_executor(fn, grad_.sens_param, *args, **kwargs)
-                _pynative_executor.clear_grad(fn, *args, **kwargs)
-                if self.get_value:
-                    return res, out
-                if self.has_aux:
-                    return out, res[1:]
-                return out
+                return grad_(fn_, weights, grad_position)(*args, **kwargs)
         else:
-            grad_.pynative_ = True
-            fn_ = fn
-            if self.has_aux:
-                fn_ = aux_fn
-            # after_grad of this branch can't use @ms_function, just directly call grad_
-            if self.get_by_position:
+            if self.get_by_list:
                 def after_grad(*args, **kwargs):
-                    return grad_(fn_, weights, grad_position)(*args, **kwargs)
+                    return grad_(fn_, weights)(*args, **kwargs)
             else:
-                if self.get_by_list:
-                    def after_grad(*args, **kwargs):
-                        return grad_(fn_, weights)(*args, **kwargs)
-                else:
-                    def after_grad(*args, **kwargs):
-                        return grad_(fn_)(*args, **kwargs)
-
-        self.grad_fn = after_grad
-        self.fn = fn
-        self.grad_position = grad_position
-        self.weights_id = weights_id
-        self.grad_hash_id = (grad_position, weights_id)
-        return self.grad_fn
+                def after_grad(*args, **kwargs):
+                    return grad_(fn_)(*args, **kwargs)
+        return after_grad
 
-    def _pynative_forward_run(self, fn, grad, args, kwargs):
+    def _pynative_forward_run(self, fn, is_function, grad, grad_hash_id, args, kwargs):
         """ Pynative forward runs to build grad graph. """
-        new_kwargs = kwargs
         outputs = ()
-        if self.sens_param:
-            if 'sens' in kwargs.keys():
-                new_kwargs = kwargs.copy()
-                new_kwargs.pop('sens')
-            else:
-                args = args[:-1]
-        if isinstance(fn, FunctionType):
-            if not _pynative_executor.check_run(grad, fn, self.grad_hash_id, *args, **new_kwargs):
+        args, new_kwargs = _get_forward_inputs(self.sens_param, args, kwargs)
+        if is_function:
+            if not _pynative_executor.check_run(grad, fn, grad_hash_id, *args, **new_kwargs):
                 _pynative_executor.set_grad_flag(True)
                 _pynative_executor.new_graph(fn, *args, **new_kwargs)
                 outputs = fn(*args, **new_kwargs)
@@ -579,7 +667,7 @@ class _Grad(GradOperation_):
                 return outputs
         else:
             # Check if fn has run already.
-            if not _pynative_executor.check_run(grad, fn, self.grad_hash_id, *args, **new_kwargs):
+            if not _pynative_executor.check_run(grad, fn, grad_hash_id, *args, **new_kwargs):
                 fn.set_grad()
                 outputs = fn(*args, **new_kwargs)
                 fn.set_grad(False)
@@ -589,27 +677,74 @@ class _Grad(GradOperation_):
         return outputs
 
 
+def _get_vmap_axes_key(axes):
+    """Convert the vmap axes to a hashable key, keeping list axes distinguishable from tuple axes."""
+    if isinstance(axes, list):
+        return (list,) + tuple(_get_vmap_axes_key(axis) for axis in axes)
+    if isinstance(axes, tuple):
+        return tuple(_get_vmap_axes_key(axis) for axis in axes)
+    return axes
+
+
 class _Vmap(VmapOperation_):
     """
     A higher-order function which is used to generate the vectorizing map function.
     """
 
+    __slots__ = ('_vmap_fn_cache',)
+
     def __init__(self):
         """Initialize _Vmap."""
         VmapOperation_.__init__(self, 'vmap')
-        self.vmap_fn = None
-        self.fn = None
+        self._vmap_fn_cache = {}
 
     def __call__(self, fn, in_axes=0, out_axes=0):
+        cache_key = (fn, _get_vmap_axes_key(in_axes), _get_vmap_axes_key(out_axes))
+        vmap_fn = _get_cached_fn(self._vmap_fn_cache, cache_key)
+        if vmap_fn is not None:
+            return vmap_fn
         vmap_ = self
+        # The cache key is a snapshot of the axes, so the wrapper must not see later changes to the caller's lists.
+        in_axes = deepcopy(in_axes)
+        out_axes = deepcopy(out_axes)
 
         @ms_function
         def after_vmap(*args):
             return vmap_(fn, in_axes, out_axes)(*args)
 
-        self.vmap_fn = after_vmap
-        self.fn = fn
-        return self.vmap_fn
+        _cache_fn(self._vmap_fn_cache, cache_key, after_vmap)
+        return after_vmap
+
+
+def _get_obj_dtype(obj):
+    """Get the MindSpore data type of obj, with fast paths for Tensor and python builtin types."""
+    obj_type = type(obj)
+    if obj_type is Tensor:
+        return mstype.tensor_type(obj.dtype)
+    dtype = mstype._simple_types.get(obj_type)  # pylint: disable=W0212
+    if dtype is not None:
+        return dtype
+    return mstype.get_py_obj_dtype(obj)
+
+
+@lru_cache(maxsize=None)
+def _str_to_type(type_name):
+    """Convert the type name used by MultitypeFuncGraph.register to MindSpore type."""
+    return mstype.typing.str_to_type(type_name)
+
+
+def _match_entry(node, types, depth=0):
+    """Find the earliest registered (index, fn) entry under the signature trie node which matches types[depth:]."""
+    if depth == len(types):
+        return node.get(None)
+    matched = None
+    for sig_type, child in node.items():
+        if not mstype._issubclass_(types[depth], sig_type):  # pylint: disable=W0212
+            continue
+        entry = _match_entry(child, types, depth + 1)
+        if entry is not None and (matched is None or entry[0] < matched[0]):
+            matched = entry
+    return matched
 
 
 class MultitypeFuncGraph(MultitypeFuncGraph_):
@@ -656,10 +791,15 @@ class MultitypeFuncGraph(MultitypeFuncGraph_):
         [0.2 1.2 2.4]
     """
 
+    __slots__ = ('entries', '_entries_trie', '_dispatch_cache')
+
     def __init__(self, name, read_value=False):
         """Initialize MultitypeFuncGraph."""
         MultitypeFuncGraph_.__init__(self, name)
         self.entries = list()
+        # Registered signatures grouped by arity, then by the signature of each argument position.
+        self._entries_trie = {}
+        self._dispatch_cache = {}
         if read_value:
             self.set_signatures((
                 sig.make_sig('args', sig.sig_rw.RW_READ, sig.sig_kind.KIND_VAR_POSITIONAL),))
@@ -668,14 +808,15 @@ class MultitypeFuncGraph(MultitypeFuncGraph_):
         if len(self.entries) == 1:
             output = self.entries[0][1](*args)
             return output
-        types = tuple(map(mstype.get_py_obj_dtype, args))
-        for sigs, fn in self.entries:
-            if len(sigs) != len(types):
-                continue
-            if any(not mstype._issubclass_(type_, sig) for sig, type_ in zip(sigs, types)):  # pylint: disable=W0212
-                continue
-            output = fn(*args)
-            return output
+        types = tuple(map(_get_obj_dtype, args))
+        fn = self._dispatch_cache.get(types)
+        if fn is not None:
+            return fn(*args)
+        entry = _match_entry(self._entries_trie.get(len(types), {}), types)
+        if entry is not None:
+            fn = entry[1]
+            self._dispatch_cache[types] = fn
+            return fn(*args)
         raise ValueError(f"For 'MultitypeFuncGraph', cannot find fn match given args. Got (sigs, fn): {self.entries}, "
                          f"and (dtype, args): {types}.")
 
@@ -693,7 +834,7 @@ class MultitypeFuncGraph(MultitypeFuncGraph_):
         def deco(fn):
             def convert_type(type_input):
                 if isinstance(type_input, str):
-                    return mstype.typing.str_to_type(type_input)
+                    return _str_to_type(type_input)
                 if not isinstance(type_input, mstype.Type):
                     raise TypeError(f"For 'MultitypeFuncGraph', register only support str or {mstype.Type}, but got "
                                     f"'type_input': {type_input}.")
@@ -701,11 +842,47 @@ class MultitypeFuncGraph(MultitypeFuncGraph_):
 
             types = tuple(map(convert_type, type_names))
             self.register_fn(type_names, fn)
+            node = self._entries_trie.setdefault(len(types), {})
+            for type_ in types:
+                node = node.setdefault(type_, {})
+            # The earliest registered function wins when several signatures are the same.
+            node.setdefault(None, (len(self.entries), fn))
             self.entries.append((types, fn))
+            self._dispatch_cache.clear()
             return fn
         return deco
 
 
+def _hyper_map(func, args_list):
+    """Apply func to the leaves of the nested sequences in args_list."""
+    # is leaf
+    if not isinstance(args_list[0], (tuple, list)):
+        return func(*args_list)
+    # Walk the nested sequences depth-first with an explicit stack, collecting the leaf rows and the
+    # pre-order layout (row count of each sequence, None for a leaf), then rebuild the output tuples.
+    leaf_rows = []
+    layout = []
+    stack = [args_list]
+    while stack:
+        items = stack.pop()
+        if not isinstance(items[0], (tuple, list)):
+            leaf_rows.append(items)
+            layout.append(None)
+            continue
+        rows = list(zip(*items))
+        layout.append(len(rows))
+        stack.extend(reversed(rows))
+    outputs = list(starmap(func, leaf_rows))
+    # Rebuild bottom-up: the first child of a sequence is always on top of the stack.
+    stack = []
+    for size in reversed(layout):
+        if size is None:
+            stack.append(outputs.pop())
+        else:
+            stack.append(tuple(stack.pop() for _ in range(size)))
+    return stack[0]
+
+
 class HyperMap(HyperMap_):
     """
     Hypermap will apply the set operation to input sequences.
@@ -765,6 +942,8 @@ class HyperMap(HyperMap_):
         (Tensor(shape=[], dtype=Float32, value= 9), Tensor(shape=[], dtype=Float32, value= 16)))
     """
 
+    __slots__ = ('ops',)
+
     def __init__(self, ops=None, reverse=False):
         """Initialize HyperMap."""
         self.ops = ops
@@ -774,17 +953,9 @@ class HyperMap(HyperMap_):
             HyperMap_.__init__(self, reverse)
 
     def __call__(self, *args):
-        func = self.ops
-        args_list = args
-        hypermap = self
         if self.ops is None:
-            func = args[0]
-            args_list = args[1:]
-            hypermap = partial(self, func)
-        # is leaf
-        if not isinstance(args_list[0], (tuple, list)):
-            return func(*args_list)
-        return tuple(map(hypermap, *args_list))
+            return _hyper_map(args[0], args[1:])
+        return _hyper_map(self.ops, args)
 
 
 class Map(Map_):
@@ -846,12 +1017,45 @@ class Map(Map_):
             Map_.__init__(self, reverse)
 
     def __call__(self, *args):
-        func = self.ops
-        args_list = args
         if self.ops is None:
-            func = args[0]
-            args_list = args[1:]
-        return tuple(map(func, *args_list))
+            return tuple(map(args[0], *args[1:]))
+        return tuple(map(self.ops, *args))
+
+
+def _check_shard_context():
+    """Check that the current context supports Shard, the context may be changed between calls."""
+    mode = context._get_mode()  # pylint: disable=W0212
+    if mode != context.PYNATIVE_MODE or context.get_auto_parallel_context("parallel_mode") not in ["auto_parallel"]:
+        raise AssertionError(f"'Shard' only supports auto parallel under PyNative mode")
+    if context.get_context("device_target") not in ["Ascend"]:
+        raise AssertionError(f"'Shard' now only supports 'Ascend'")
+    if context.get_auto_parallel_context("full_batch"):
+        raise AssertionError(f"'Shard' doesn't support 'full_batch'. Please set 'full_batch' as False")
+    if context.get_auto_parallel_context("search_mode") != "sharding_propagation":
+        raise AssertionError(f"'search_mode' must be 'sharding_propagation' for 'Shard'")
+
+
+def _check_shard_args(in_strategy, out_strategy, parameter_plan, device, level):
+    """Check the types of the Shard arguments."""
+    if not isinstance(in_strategy, tuple):
+        raise TypeError(f"For 'Shard', the 'in_strategy' should be a tuple, but got {type(in_strategy).__name__}")
+    if not isinstance(out_strategy, tuple):
+        raise TypeError(f"For 'Shard', the 'out_strategy' should be a tuple, "
+                        f"but got {type(out_strategy).__name__}")
+    if not isinstance(parameter_plan, (tuple, type(None))):
+        raise TypeError(f"For 'Shard', the 'parameter_plan' should be a tuple or None, "
+                        f"but got {type(parameter_plan).__name__}")
+    if isinstance(parameter_plan, tuple):
+        for k, v in parameter_plan:
+            if not isinstance(k, str) or not isinstance(v, tuple):
+                raise TypeError(f"For 'Shard', the type of each key and value in 'parameter_plan' must be str and "
+                                f"tuple, but got {type(k).__name__} and {type(v).__name__}")
+    if not isinstance(device, str):
+        raise TypeError(f"For 'Shard', the 'device' should be a string, "
+                        f"but got {type(device).__name__}")
+    if not isinstance(level, int):
+        raise TypeError(f"For 'Shard', the 'level' should be an integer, "
+                        f"but got {type(level).__name__}")
 
 
 class Shard(Shard_):
@@ -868,34 +1072,10 @@ class Shard(Shard_):
         self.level = None
 
     def __call__(self, fn, in_strategy, out_strategy, parameter_plan=None, device="Ascend", level=0):
-        if context.get_context("mode") != context.PYNATIVE_MODE or \
-            context.get_auto_parallel_context("parallel_mode") not in ["auto_parallel"]:
-            raise AssertionError(f"'Shard' only supports auto parallel under PyNative mode")
-        if context.get_context("device_target") not in ["Ascend"]:
-            raise AssertionError(f"'Shard' now only supports 'Ascend'")
-        if context.get_auto_parallel_context("full_batch"):
-            raise AssertionError(f"'Shard' doesn't support 'full_batch'. Please set 'full_batch' as False")
-        if context.get_auto_parallel_context("search_mode") != "sharding_propagation":
-            raise AssertionError(f"'search_mode' must be 'sharding_propagation' for 'Shard'")
-        if not isinstance(in_strategy, tuple):
-            raise TypeError(f"For 'Shard', the 'in_strategy' should be a tuple, but got {type(in_strategy).__name__}")
-        if not isinstance(out_strategy, tuple):
-            raise TypeError(f"For 'Shard', the 'out_strategy' should be a tuple, "
-                            f"but got {type(out_strategy).__name__}")
-        if not isinstance(parameter_plan, (tuple, type(None))):
-            raise TypeError(f"For 'Shard', the 'parameter_plan' should be a tuple or None, "
-                            f"but got {type(parameter_plan).__name__}")
-        if isinstance(parameter_plan, tuple):
-            for k, v in parameter_plan:
-                if not isinstance(k, str) or not isinstance(v, tuple):
-                    raise TypeError(f"For 'Shard', the type of each key and value in 'parameter_plan' must be str and "
-                                    f"tuple, but got {type(k).__name__} and {type(parameter_plan[v]).__name__}")
-        if not isinstance(device, str):
-            raise TypeError(f"For 'Shard', the 'device' should be a string, "
-                            f"but got {type(device).__name__}")
-        if not isinstance(level, int):
-            raise TypeError(f"For 'Shard', the 'level' should be an integer, "
-                            f"but got {type(level).__name__}")
+        _check_shard_context()
+        # Type checks only, skipped under `python -O`; the context check above guards correctness.
+        if __debug__:
+            _check_shard_args(in_strategy, out_strategy, parameter_plan, device, level)
 
         if ms.get_algo_parameters("fully_use_devices") is True:
             logger.warning("After calling 'shard', the environment variable 'fully_use_devices' "
@@ -936,6 +1116,8 @@ class _ListAppend(ListAppend_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListAppend."""
         ListAppend_.__init__(self, name)
@@ -955,6 +1137,8 @@ class _ListInsert(ListInsert_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListInsert."""
         ListInsert_.__init__(self, name)
@@ -974,6 +1158,8 @@ class _ListPop(ListPop_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListPop."""
         ListPop_.__init__(self, name)
@@ -993,6 +1179,8 @@ class _ListClear(ListClear_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListClear."""
         ListClear_.__init__(self, name)
@@ -1012,6 +1200,8 @@ class _ListReverse(ListReverse_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListReverse."""
         ListReverse_.__init__(self, name)
@@ -1031,6 +1221,8 @@ class _ListExtend(ListExtend_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListExtend."""
         ListExtend_.__init__(self, name)
@@ -1050,6 +1242,8 @@ class _ListCount(ListCount_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ListCount."""
         ListCount_.__init__(self, name)
@@ -1069,6 +1263,8 @@ class _Tail(Tail_):
         name (str): The name of the metafuncgraph object.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _Tail."""
         Tail_.__init__(self, name)
@@ -1083,6 +1279,8 @@ tail = _Tail('tail')
 class _ZipOperation(ZipOperation_):
     """Generates a tuple of zip iterations for inputs."""
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Initialize _ZipOperation."""
         ZipOperation_.__init__(self, name)
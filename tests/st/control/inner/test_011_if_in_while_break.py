@@ -22,13 +22,16 @@ from mindspore import context
 
 context.set_context(mode=context.GRAPH_MODE)
 
+# Scalar tensors are never modified in place by the nets below, so one instance can be shared.
+ZERO_I32 = Tensor(0, mstype.int32)
+
 
 class ForwardNet(nn.Cell):
     def __init__(self, max_cycles=10):
         super(ForwardNet, self).__init__()
         self.max_cycles = max_cycles
-        self.i = Tensor(np.array(0), mstype.int32)
-        self.zero = Tensor(np.array(0), mstype.int32)
+        self.i = ZERO_I32
+        self.zero = ZERO_I32
 
     def construct(self, x, y):
         i = self.i
@@ -56,8 +59,8 @@ class ForwardNetReplaceBreak(nn.Cell):
     def __init__(self, max_cycles=10):
         super(ForwardNetReplaceBreak, self).__init__()
         self.max_cycles = max_cycles
-        self.i = Tensor(np.array(0), mstype.int32)
-        self.zero = Tensor(np.array(0), mstype.int32)
+        self.i = ZERO_I32
+        self.zero = ZERO_I32
 
     def construct(self, x, y):
         i = self.i
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ============================================================================
+from functools import lru_cache
+
 import numpy as np
 import pytest
 import mindspore
@@ -25,10 +27,16 @@ from mindspore.common.parameter import Parameter
 from mindspore.ops.functional import vmap
 
 
+@lru_cache(maxsize=None)
+def _get_space_to_batch_nd(block_size, paddings):
+    """Share one SpaceToBatchND primitive between nets with the same attributes."""
+    return ops.SpaceToBatchND(block_shape=block_size, paddings=[list(pad) for pad in paddings])
+
+
 class SpaceToBatchNDNet(nn.Cell):
     def __init__(self, nptype, block_size=2, input_shape=(1, 1, 4, 4)):
         super(SpaceToBatchNDNet, self).__init__()
-        self.space_to_batch_nd = ops.SpaceToBatchND(block_shape=block_size, paddings=[[0, 0], [0, 0]])
+        self.space_to_batch_nd = _get_space_to_batch_nd(block_size, ((0, 0), (0, 0)))
         input_size = np.prod(input_shape)
         data_np = np.arange(input_size).reshape(input_shape).astype(nptype)
         self.x1 = Parameter(initializer(Tensor(data_np), input_shape), name='x1')
@@ -39,59 +47,38 @@ class SpaceToBatchNDNet(nn.Cell):
         return y1
 
 
+def space_to_batch_nd_np(x, block_h, block_w):
+    """SpaceToBatchND on an NCHW array without paddings."""
+    n, c, h, w = x.shape
+    # Split H and W into (H / block, block) and move both block axes in front of the batch axis.
+    return x.reshape(n, c, h // block_h, block_h, w // block_w, block_w) \
+        .transpose(3, 5, 0, 1, 2, 4).reshape(block_h * block_w * n, c, h // block_h, w // block_w)
+
+
 def space_to_batch_nd_test_case(nptype, block_size=2, input_shape=(1, 1, 4, 4)):
-    expect = np.array([[[[0, 2],
-                         [8, 10]]],
-                       [[[1, 3],
-                         [9, 11]]],
-                       [[[4, 6],
-                         [12, 14]]],
-                       [[[5, 7],
-                         [13, 15]]]]).astype(nptype)
+    arr = np.arange(np.prod(input_shape)).reshape(input_shape).astype(nptype)
+    expect = space_to_batch_nd_np(arr, block_size, block_size)
 
     dts = SpaceToBatchNDNet(nptype, block_size, input_shape)
     output = dts()
 
-    assert (output.asnumpy() == expect).all()
-
-
-def space_to_batch_nd_all_dtype():
-    space_to_batch_nd_test_case(np.float32)
-    space_to_batch_nd_test_case(np.float16)
-    space_to_batch_nd_test_case(np.int8)
-    space_to_batch_nd_test_case(np.int16)
-    space_to_batch_nd_test_case(np.int32)
-    space_to_batch_nd_test_case(np.int64)
-    space_to_batch_nd_test_case(np.uint8)
-    space_to_batch_nd_test_case(np.uint16)
-    space_to_batch_nd_test_case(np.uint32)
-    space_to_batch_nd_test_case(np.uint64)
-
-
-@pytest.mark.level0
-@pytest.mark.platform_x86_cpu
-@pytest.mark.env_onecard
-def test_space_to_batch_nd_graph():
-    """
-    Feature: test SpaceToBatchND function interface.
-    Description: test interface.
-    Expectation: the result match with numpy result
-    """
-    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
-    space_to_batch_nd_all_dtype()
+    assert np.array_equal(output.asnumpy(), expect)
 
 
 @pytest.mark.level0
 @pytest.mark.platform_x86_cpu
 @pytest.mark.env_onecard
-def test_space_to_batch_nd_pynative():
+@pytest.mark.parametrize('mode', [context.GRAPH_MODE, context.PYNATIVE_MODE])
+@pytest.mark.parametrize('nptype', [np.float32, np.float16, np.int8, np.int16, np.int32, np.int64,
+                                    np.uint8, np.uint16, np.uint32, np.uint64])
+def test_space_to_batch_nd_dtype(nptype, mode):
     """
     Feature: test SpaceToBatchND function interface.
     Description: test interface.
     Expectation: the result match with numpy result
     """
-    context.set_context(mode=context.PYNATIVE_MODE, device_target='CPU')
-    space_to_batch_nd_all_dtype()
+    context.set_context(mode=mode, device_target='CPU')
+    space_to_batch_nd_test_case(nptype)
 
 
 @pytest.mark.level0
@@ -140,29 +127,24 @@ def test_space_to_batch_nd_dynamic():
     Description: the input to SpaceToBatchND is dynamic.
     Expectation: the result match with numpy result
     """
-    x = np.array([[[[1, 2, 3, 4], [5, 6, 7, 8]]], [[[1, 2, 3, 4], [5, 6, 7, 8]]],
-                  [[[1, 2, 3, 4], [5, 6, 7, 8]]], [[[1, 2, 3, 4], [5, 6, 7, 8]]]]).astype(np.float32)
+    row = np.array([[[[1, 2, 3, 4], [5, 6, 7, 8]]]], np.float32)
+    x = np.tile(row, (4, 1, 1, 1))
+    indices = np.array([0, 0, 1, 0])
     block_size = [2, 2]
     paddings = [[0, 0], [0, 0]]
 
     input_x = Tensor(x, mindspore.float32)
-    input_y = Tensor(np.array([0, 0, 1, 0]), mindspore.int32)
-    expect = np.array([[[[1., 3.]]],
-                       [[[1., 3.]]],
-                       [[[2., 4.]]],
-                       [[[2., 4.]]],
-                       [[[5., 7.]]],
-                       [[[5., 7.]]],
-                       [[[6., 8.]]],
-                       [[[6., 8.]]]]).astype(np.float32)
+    input_y = Tensor(indices, mindspore.int32)
+    # Unique keeps first occurrences in order, which for these indices matches np.unique.
+    expect = space_to_batch_nd_np(x[np.unique(indices)], *block_size)
     dyn_net = SpaceToBatchNDDynamicShapeNetMS(block_size, paddings)
 
     context.set_context(mode=context.PYNATIVE_MODE, device_target="CPU")
     output = dyn_net(input_x, input_y)
-    assert (output.asnumpy() == expect).all()
+    assert np.array_equal(output.asnumpy(), expect)
     context.set_context(mode=context.GRAPH_MODE, device_target="CPU")
     output = dyn_net(input_x, input_y)
-    assert (output.asnumpy() == expect).all()
+    assert np.array_equal(output.asnumpy(), expect)
 
 
 def vmap_case():
@@ -13,7 +13,6 @@
 # limitations under the License.
 # ============================================================================
 
-from functools import reduce
 import numpy as np
 import pytest
 
@@ -23,6 +22,14 @@ import mindspore.nn as nn
 import mindspore.ops as ops
 from mindspore import Tensor
 
+# The input and reference do not depend on device or mode, so every case shares them.
+PADDINGS = ((1, 0), (0, 2))
+SHAPE = (4, 4)
+SHAPE_DYN = (None, 4)
+X = np.arange(np.prod(SHAPE)).reshape(SHAPE).astype(np.float32)
+INPUT_X = Tensor(X)
+EXPECT = np.pad(X, PADDINGS, mode="constant", constant_values=0)
+
 
 class PadNet(nn.Cell):
     def __init__(self, paddings):
@@ -34,60 +41,27 @@ class PadNet(nn.Cell):
 
 
 def run_case():
-    paddings = ((1, 0), (0, 2))
-    shape = (4, 4)
-    shape_dyn = (None, 4)
-    sz = reduce(lambda a, b: a * b, shape)
-    x = np.arange(sz).reshape(shape).astype(np.float32)
-    expect = np.pad(x, paddings, mode="constant", constant_values=0)
-    x_dyn = Tensor(shape=shape_dyn, dtype=mindspore.float32)
-    net = PadNet(paddings)
+    x_dyn = Tensor(shape=SHAPE_DYN, dtype=mindspore.float32)
+    net = PadNet(PADDINGS)
     net.set_inputs(x_dyn)
-    output = net(Tensor(x))
-    assert (output.asnumpy() == expect).all()
-
-
-@pytest.mark.level0
-@pytest.mark.platform_x86_cpu
-@pytest.mark.env_onecard
-def test_pad_dyn_cpu():
-    """
-    Feature: test Pad dynamic shape on CPU.
-    Description: inputs is dynamic shape.
-    Expectation: the result match with expect
-    """
-    context.set_context(mode=context.GRAPH_MODE, device_target="CPU")
-    run_case()
-    context.set_context(mode=context.PYNATIVE_MODE, device_target="CPU")
-    run_case()
+    output = net(INPUT_X)
+    assert np.array_equal(output.asnumpy(), EXPECT)
 
 
 @pytest.mark.level0
-@pytest.mark.platform_x86_gpu_training
 @pytest.mark.env_onecard
-def test_pad_dyn_gpu():
+@pytest.mark.parametrize('mode', [context.GRAPH_MODE, context.PYNATIVE_MODE])
+@pytest.mark.parametrize('device', [
+    pytest.param("CPU", marks=pytest.mark.platform_x86_cpu),
+    pytest.param("GPU", marks=pytest.mark.platform_x86_gpu_training),
+    pytest.param("Ascend", marks=[pytest.mark.platform_arm_ascend_training,
+                                  pytest.mark.platform_x86_ascend_training]),
+])
+def test_pad_dyn(device, mode):
     """
-    Feature: test Pad dynamic shape on GPU.
+    Feature: test Pad dynamic shape.
     Description: inputs is dynamic shape.
     Expectation: the result match with expect
     """
-    context.set_context(mode=context.GRAPH_MODE, device_target="GPU")
-    run_case()
-    context.set_context(mode=context.PYNATIVE_MODE, device_target="GPU")
-    run_case()
-
-
-@pytest.mark.level0
-@pytest.mark.platform_arm_ascend_training
-@pytest.mark.platform_x86_ascend_training
-@pytest.mark.env_onecard
-def test_pad_dyn_ascend():
-    """
-    Feature: test Pad dynamic shape on Ascend.
-    Description: inputs is dynamic shape.
-    Expectation: the result match with expect
-    """
-    context.set_context(mode=context.GRAPH_MODE, device_target="Ascend")
-    run_case()
-    context.set_context(mode=context.PYNATIVE_MODE, device_target="Ascend")
+    context.set_context(mode=mode, device_target=device)
     run_case()
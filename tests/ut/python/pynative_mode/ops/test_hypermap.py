@@ -170,3 +170,11 @@ def test_hypermap_add3_tuple():
     tensor2 = Tensor(np.array([[1.2, 2.1], [2.2, 3.2]]).astype('float32'))
 
     main_add3((tensor1, 1), (tensor2, 1))
+
+
+def test_hypermap_nested_python_call():
+    def scalar_add_py(x, y):
+        return x + y
+
+    common_map = C.HyperMap()
+    assert common_map(scalar_add_py, ((1, 2), (3,)), ((4, 5), (6,))) == ((5, 7), (9,))
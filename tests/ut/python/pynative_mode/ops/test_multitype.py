@@ -88,3 +88,44 @@ def test_multitype_tensor_by_type():
     tensor2 = Tensor(np.array([[1.2, 2.1], [2.2, 3.2]]).astype('float32'))
     out = mainf2(tensor1, tensor2)
     print(out)
+
+
+dispatch = C.MultitypeFuncGraph('dispatch')
+@dispatch.register("Number")
+def dispatch_number(x):
+    return "number"
+
+
+@dispatch.register("Tensor")
+def dispatch_tensor(x):
+    return "tensor"
+
+
+def test_multitype_dispatch_cache():
+    tensor = Tensor(np.array([1.2, 2.1]).astype('float32'))
+    assert dispatch(1) == "number"
+    assert dispatch(tensor) == "tensor"
+    assert dispatch(2) == "number"
+    assert dispatch(tensor) == "tensor"
+
+
+overlap = C.MultitypeFuncGraph('overlap')
+@overlap.register("Number", "Number")
+def overlap_number(x, y):
+    return "number"
+
+
+@overlap.register(mstype.int64, mstype.int64)
+def overlap_int(x, y):
+    return "int"
+
+
+@overlap.register("Number", "Tensor")
+def overlap_number_tensor(x, y):
+    return "tensor"
+
+
+def test_multitype_dispatch_registration_order():
+    tensor = Tensor(np.array([1.2, 2.1]).astype('float32'))
+    assert overlap(1, 2) == "number"
+    assert overlap(1, tensor) == "tensor"
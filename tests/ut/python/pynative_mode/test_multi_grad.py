@@ -209,3 +209,95 @@ def test_net_inner_first_run_grad():
     grad_add = GradOfFirstInput(mulnet)
     grad_mul(x, y, sens)
     grad_add(x, y, sens)
+
+
+def test_grad_operation_cache_multi_fn():
+    def fn1(x):
+        return x * 2
+
+    def fn2(x):
+        return x * 3
+
+    grad_op = C.GradOperation()
+    grad_fn1 = grad_op(fn1)
+    grad_fn2 = grad_op(fn2)
+    assert grad_op(fn1) is grad_fn1
+    assert grad_op(fn2) is grad_fn2
+
+
+def test_grad_operation_cache_lru():
+    """
+    Feature: GradOperation grad function cache.
+    Description: re-use one fn while more fns than the cache size are differentiated.
+    Expectation: the recently used grad function stays cached, the least recently used one is evicted.
+    """
+    def make_fn(scale):
+        def fn(x):
+            return x * scale
+        return fn
+
+    hot_fn = make_fn(2)
+    cold_fn = make_fn(3)
+    grad_op = C.GradOperation()
+    hot_grad_fn = grad_op(hot_fn)
+    cold_grad_fn = grad_op(cold_fn)
+    for scale in range(4, 4 + C.base._FN_CACHE_SIZE - 2):  # pylint: disable=W0212
+        grad_op(make_fn(scale))
+    assert grad_op(hot_fn) is hot_grad_fn
+    grad_op(make_fn(0))
+    assert grad_op(hot_fn) is hot_grad_fn
+    assert grad_op(cold_fn) is not cold_grad_fn
+
+
+def test_grad_cache_grad_position():
+    """
+    Feature: _Grad grad function cache.
+    Description: get the grad function of one fn with different grad_position.
+    Expectation: each grad_position gets its own cached grad function.
+    """
+    def fn(x, y):
+        return x * y
+
+    grad_op = C._Grad(get_by_position=True)  # pylint: disable=W0212
+    grad_fn0 = grad_op(fn, None, 0)
+    grad_fn1 = grad_op(fn, None, 1)
+    assert grad_fn0 is not grad_fn1
+    assert grad_op(fn, None, 0) is grad_fn0
+    assert grad_op(fn, None, 1) is grad_fn1
+    context.set_context(mode=context.GRAPH_MODE)
+    try:
+        assert grad_op(fn, None, 0) is not grad_fn0
+    finally:
+        context.set_context(mode=context.PYNATIVE_MODE)
+    assert grad_op(fn, None, 0) is grad_fn0
+
+
+def test_grad_operation_cache_mode_switch():
+    """
+    Feature: GradOperation grad function cache.
+    Description: switch to GRAPH_MODE between getting the grad functions of two fns, then switch back.
+    Expectation: a new grad function is built for GRAPH_MODE, and the cached PYNATIVE_MODE one still computes
+        the same gradient after switching back.
+    """
+    def fn1(x):
+        return x * 2
+
+    def fn2(x):
+        return x * 3
+
+    x = Tensor(np.ones([2]), dtype=mstype.float32)
+    expect = np.full([2], 2, np.float32)
+    grad_op = C.GradOperation()
+    pynative_grad_fn1 = grad_op(fn1)
+    grad_op(fn2)
+    assert np.array_equal(pynative_grad_fn1(x).asnumpy(), expect)
+    context.set_context(mode=context.GRAPH_MODE)
+    try:
+        graph_grad_fn1 = grad_op(fn1)
+        assert graph_grad_fn1 is not pynative_grad_fn1
+        assert grad_op(fn1) is graph_grad_fn1
+    finally:
+        context.set_context(mode=context.PYNATIVE_MODE)
+    cached_grad_fn1 = grad_op(fn1)
+    assert cached_grad_fn1 is pynative_grad_fn1
+    assert np.array_equal(cached_grad_fn1(x).asnumpy(), expect)
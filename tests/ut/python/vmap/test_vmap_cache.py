@@ -0,0 +1,94 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test vmap function cache"""
+import numpy as np
+import mindspore.context as context
+from mindspore import Tensor
+from mindspore import dtype as mstype
+from mindspore.ops import composite as C
+from mindspore.ops.functional import vmap
+
+context.set_context(mode=context.GRAPH_MODE)
+
+
+def add(x, y):
+    return x + y
+
+
+def test_vmap_cache_same_fn():
+    """
+    Feature: vmap function cache.
+    Description: vmap one fn twice with the same axes.
+    Expectation: the same vmap function is returned.
+    """
+    assert vmap(add) is vmap(add)
+
+
+def test_vmap_cache_different_axes():
+    """
+    Feature: vmap function cache.
+    Description: vmap one fn with different in_axes and out_axes.
+    Expectation: each axes configuration gets its own vmap function.
+    """
+    vmap_fn = vmap(add, 0, 0)
+    vmap_fn_in_axes = vmap(add, 1, 0)
+    vmap_fn_out_axes = vmap(add, 0, 1)
+    assert vmap_fn is not vmap_fn_in_axes
+    assert vmap_fn is not vmap_fn_out_axes
+    assert vmap_fn_in_axes is not vmap_fn_out_axes
+
+
+def test_vmap_cache_list_tuple_axes():
+    """
+    Feature: vmap function cache.
+    Description: vmap one fn with list in_axes and with the equal tuple in_axes.
+    Expectation: list and tuple axes do not share a cache entry, and each is reused on repeat calls.
+    """
+    list_vmap_fn = vmap(add, [0, None])
+    tuple_vmap_fn = vmap(add, (0, None))
+    assert list_vmap_fn is not tuple_vmap_fn
+    assert vmap(add, [0, None]) is list_vmap_fn
+    assert vmap(add, (0, None)) is tuple_vmap_fn
+
+
+def test_vmap_cache_hit_result():
+    """
+    Feature: vmap function cache.
+    Description: run the cached vmap function and a vmap function built by a fresh vmap instance.
+    Expectation: both give the same result.
+    """
+    x_hat = Tensor([[1, 2, 3], [4, 5, 6]], mstype.float32)
+    y_hat = Tensor([[1, 2, 3], [4, 5, 6]], mstype.float32)
+    vmap(add, (0, 0))
+    cached_out = vmap(add, (0, 0))(x_hat, y_hat)
+    fresh_out = C._Vmap()(add, (0, 0))(x_hat, y_hat)  # pylint: disable=W0212
+    assert np.array_equal(cached_out.asnumpy(), fresh_out.asnumpy())
+
+
+def test_vmap_cache_mutated_axes():
+    """
+    Feature: vmap function cache.
+    Description: change the caller's in_axes list after vmap, then vmap again with the original axes.
+    Expectation: the cached vmap function still maps with the axes it was created with.
+    """
+    x_hat = Tensor([[1, 2, 3], [4, 5, 6]], mstype.float32)
+    y_hat = Tensor([[1, 2, 3], [4, 5, 6]], mstype.float32)
+    in_axes = [0, 0]
+    vmap_fn = vmap(add, in_axes)
+    in_axes[1] = None
+    cached_vmap_fn = vmap(add, [0, 0])
+    assert cached_vmap_fn is vmap_fn
+    expect = x_hat.asnumpy() + y_hat.asnumpy()
+    assert np.array_equal(cached_vmap_fn(x_hat, y_hat).asnumpy(), expect)